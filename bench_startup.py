@@ -0,0 +1,101 @@
+
+import argparse
+import asyncio
+import contextlib
+import io
+import shutil
+import subprocess
+import sys
+import time
+
+from scraper import (
+    RANKEDIN_URL,
+    START_URLS,
+    USER_AGENT,
+    accept_rankedin_cookies,
+    build_parser,
+    has_profile,
+    has_saved_cookies,
+    open_context,
+)
+
+# Separate from scraper.CACHE_DIR so benchmarking never touches the profile
+# the next real `--warm` scrape starts from. Wiped at the start of every run.
+BENCH_CACHE_DIR = ".scraper_cache_bench"
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def time_python(code):
+    """Wall time of `python -c code` in a fresh interpreter."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - start
+
+
+def bench_import():
+    """
+    Returns (baseline, import_scraper): `python -c pass` vs `import scraper`.
+    The difference is what the module itself costs (nothing heavy should load).
+    """
+    return time_python("pass"), time_python("import scraper")
+
+
+async def bench_source(source, warm):
+    """
+    Returns (context_ready, first_response, ready) in seconds, all measured
+    from the moment we start launching the browser. `ready` is DOMContentLoaded,
+    plus the cookie consent step for Rankedin.
+    """
+    options = {"user_agent": USER_AGENT} if source == "rankedin" else {}
+    had_profile = warm and has_profile(source, BENCH_CACHE_DIR)
+
+    start = time.perf_counter()
+    async with open_context(source, warm, cache_dir=BENCH_CACHE_DIR, **options) as context:
+        page = await context.new_page()
+        cookies_restored = (
+            source == "rankedin" and had_profile and await has_saved_cookies(context, RANKEDIN_URL)
+        )
+        context_ready = time.perf_counter() - start
+
+        await page.goto(START_URLS[source], wait_until="commit", timeout=60000)
+        first_response = time.perf_counter() - start
+
+        await page.wait_for_load_state("domcontentloaded")
+        if source == "rankedin":
+            # Keep the scraper's progress prints out of the results table
+            with contextlib.redirect_stdout(io.StringIO()):
+                await accept_rankedin_cookies(page, cookies_restored)
+        ready = time.perf_counter() - start
+    return context_ready, first_response, ready
+
+
+async def main(argv=None):
+    parser = build_parser("Benchmark scraper start-up time, cold vs warm.")
+    parser.add_argument("--runs", type=positive_int, default=3, help="Runs per mode. Default: %(default)s")
+    args = parser.parse_args(argv)
+
+    shutil.rmtree(BENCH_CACHE_DIR, ignore_errors=True)
+
+    baseline, import_scraper = bench_import()
+    print(f"⏱️  python -c pass: {baseline:.3f}s, import scraper: {import_scraper:.3f}s "
+          f"(module cost {import_scraper - baseline:+.3f}s)")
+    print(f"{'source':<10} {'mode':<5} {'context':>8} {'1st resp':>9} {'ready':>7}")
+    for source in args.sources:
+        # Cold first, then warm (the first warm run fills the cache, so it is skipped)
+        for warm in (False, True):
+            if warm:
+                await bench_source(source, warm)
+            results = [await bench_source(source, warm) for _ in range(args.runs)]
+            avg = [sum(r[i] for r in results) / len(results) for i in range(3)]
+            mode = "warm" if warm else "cold"
+            print(f"{source:<10} {mode:<5} {avg[0]:>7.2f}s {avg[1]:>8.2f}s {avg[2]:>6.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,18 +1,108 @@
 
+import argparse
 import asyncio
 import json
+import os
 import random
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-from thefuzz import fuzz, process
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
+
+# Heavy dependencies (Playwright, BeautifulSoup, geopy) are imported inside the
+# functions that use them, so a run only pays for the sources it selects.
 
 OUTPUT_FILE = "frontend-poc/src/tournaments.json"
 
-async def scrape_rankedin():
+# Warm-start mode keeps one persistent Chromium profile per source in here.
+# The profile holds the browser storage state (cookies, localStorage - e.g. the
+# Rankedin cookie consent) and Chromium's HTTP disk cache for static assets.
+# CI restores/saves this folder with actions/cache.
+CACHE_DIR = ".scraper_cache"
+
+# Keep the persisted HTTP cache small so each CI cache entry stays small too.
+DISK_CACHE_SIZE = 50 * 1024 * 1024
+
+# First page each scraper opens (also used by bench_startup.py)
+RANKEDIN_URL = "https://rankedin.com/en/tournament/search"
+MATCHI_TV_URL = "https://matchi.tv/events?c=-1&t=0&il=false"
+DDG_URL = "https://duckduckgo.com/"
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+@asynccontextmanager
+async def open_context(source, warm=False, cache_dir=CACHE_DIR, **context_options):
+    """
+    Yields a Playwright browser context for one source.
+
+    Cold (default): fresh browser + empty context, nothing survives the run.
+    Warm: persistent profile under <cache_dir>/<source>, so cookies and cached
+    assets from the previous run are reused.
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        if warm:
+            context = await p.chromium.launch_persistent_context(
+                os.path.join(cache_dir, source),
+                headless=True,
+                args=[f"--disk-cache-size={DISK_CACHE_SIZE}"],
+                **context_options,
+            )
+            try:
+                yield context
+            finally:
+                await context.close()
+        else:
+            browser = await p.chromium.launch(headless=True)
+            context = await browser.new_context(**context_options)
+            try:
+                yield context
+            finally:
+                await browser.close()
+
+
+def has_profile(source, cache_dir=CACHE_DIR):
+    """True if a warm-start profile for this source was saved by an earlier run."""
+    return os.path.isdir(os.path.join(cache_dir, source))
+
+
+async def has_saved_cookies(context, url):
+    """
+    True if the context already holds persistent cookies for url.
+    Call it before navigating, so only cookies restored from the profile count.
+    """
+    cookies = await context.cookies(url)
+    return any(c["expires"] > 0 for c in cookies)
+
+
+async def accept_rankedin_cookies(page, cookies_restored):
+    """
+    Clicks Rankedin's cookie consent. The 3 s wait is only skipped when the
+    profile brought Rankedin cookies with it AND no consent banner is showing
+    right now; in every other case (cache miss, evicted cache, expired or
+    missing consent) the cold path runs.
+    """
+    accept = page.get_by_role("button", name="Accept")
+    if cookies_restored:
+        try:
+            banner_shown = await accept.is_visible()
+        except:
+            banner_shown = True # e.g. several matches, let click() deal with it
+        if not banner_shown:
+            print("🍪 Cookie consent restored from profile.")
+            return
+    try:
+        print("🍪 Clicking Cookie Consent...")
+        await accept.click(timeout=3000)
+    except:
+        pass
+
+
+async def scrape_rankedin(warm=False):
+    from bs4 import BeautifulSoup
+    from geopy.geocoders import Nominatim
+
     events = []
     print("🚀 Starting Rankedin Scraper (Real Data)...")
     
@@ -30,24 +120,17 @@ async def scrape_rankedin():
              pass
         return (None, None)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+    had_profile = warm and has_profile("rankedin")
+    async with open_context("rankedin", warm, user_agent=USER_AGENT) as context:
         page = await context.new_page()
-        page = await browser.new_page()
+        cookies_restored = had_profile and await has_saved_cookies(context, RANKEDIN_URL)
         
         # 1. Navigation
-        print("🌍 Navigating to https://rankedin.com/en/tournament/search...")
-        await page.goto("https://rankedin.com/en/tournament/search", timeout=60000)
+        print(f"🌍 Navigating to {RANKEDIN_URL}...")
+        await page.goto(RANKEDIN_URL, timeout=60000)
         
         # Cookie Consent (Try to click 'Accept' or similar)
-        try:
-            print("🍪 Clicking Cookie Consent...")
-            await page.get_by_role("button", name="Accept").click(timeout=3000)
-        except:
-            pass
+        await accept_rankedin_cookies(page, cookies_restored)
 
         # 2. Broad Search Strategy: National + Local + Time-based
         # We combine:
@@ -356,23 +439,20 @@ async def scrape_rankedin():
 
             except Exception as e:
                 continue
-
-        await browser.close()
     
     return events
 
 
 
-async def scrape_matchi_tv():
+async def scrape_matchi_tv(warm=False):
     events = []
     print("🚀 Starting Matchi TV Scraper...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    async with open_context("matchi_tv", warm) as context:
+        page = await context.new_page()
         
         # User provided verified source
-        url = "https://matchi.tv/events?c=-1&t=0&il=false"
+        url = MATCHI_TV_URL
         print(f"🌍 Navigating to {url}...")
         
         try:
@@ -449,26 +529,24 @@ async def scrape_matchi_tv():
         except Exception as e:
             print(f"⚠️ Matchi TV scrape error: {e}")
 
-        await browser.close()
     return events
 
-async def scrape_duckduckgo_regional():
+async def scrape_duckduckgo_regional(warm=False):
     events = []
     print("🚀 Starting DuckDuckGo Regional Scraper (Lidköping + 50km)...")
     
     # Focused list on Lidköping region
     cities = ["Lidköping", "Skara", "Skövde", "Mariestad", "Vara", "Vänersborg", "Trollhättan"]
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    async with open_context("ddg", warm) as context:
+        page = await context.new_page()
         
         for city in cities:
             query = f'site:matchi.se "padel" "turnering" "{city}" 2026'
             print(f"🦆 Searching DDG for: {query}...")
             
             try:
-                await page.goto(f"https://duckduckgo.com/?q={query}&kl=se-sv", timeout=30000)
+                await page.goto(f"{DDG_URL}?q={query}&kl=se-sv", timeout=30000)
                 await page.wait_for_timeout(2000)
                 
                 # Extract results
@@ -500,15 +578,65 @@ async def scrape_duckduckgo_regional():
             except Exception as e:
                 print(f"   ⚠️ DDG Error for {city}: {e}")
 
-        await browser.close()
     return events
 
-async def main():
-    # Run scraper
-    rankedin_events = await scrape_rankedin()
-    ddg_events = await scrape_duckduckgo_regional()
-    
-    all_events = rankedin_events + ddg_events
+# Source name -> scraper. Selected on the command line with --sources.
+SOURCES = {
+    "rankedin": scrape_rankedin,
+    "matchi_tv": scrape_matchi_tv,
+    "ddg": scrape_duckduckgo_regional,
+}
+DEFAULT_SOURCES = ["rankedin", "ddg"]
+START_URLS = {
+    "rankedin": RANKEDIN_URL,
+    "matchi_tv": MATCHI_TV_URL,
+    "ddg": DDG_URL,
+}
+
+
+def parse_sources(value):
+    """argparse type for --sources: comma-separated names, all must be in SOURCES."""
+    # dict.fromkeys drops repeats but keeps the given order
+    sources = list(dict.fromkeys(s.strip() for s in value.split(",") if s.strip()))
+    if not sources:
+        raise argparse.ArgumentTypeError(f"no sources given (choose from {', '.join(SOURCES)})")
+    unknown = [s for s in sources if s not in SOURCES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown source(s): {', '.join(unknown)} (choose from {', '.join(SOURCES)})"
+        )
+    return sources
+
+
+def build_parser(description):
+    """Parser with the shared --sources option (also used by bench_startup.py)."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--sources",
+        type=parse_sources,
+        default=",".join(DEFAULT_SOURCES),
+        help=f"Comma-separated sources ({', '.join(SOURCES)}). Default: %(default)s",
+    )
+    return parser
+
+
+def parse_args(argv=None):
+    parser = build_parser("Scrape Swedish padel tournaments.")
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help=f"Reuse browser state and HTTP cache from previous runs (stored in {CACHE_DIR}/)",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+
+    # Run selected scrapers
+    all_events = []
+    for source in args.sources:
+        all_events += await SOURCES[source](warm=args.warm)
     
     # Save to JSON
     print(f"💾 Saving {len(all_events)} events to {OUTPUT_FILE}...")